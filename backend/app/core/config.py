@@ -15,6 +15,9 @@ class Settings(BaseSettings):
     # .env 에서 APP_ENV=dev 같은 걸 쓰고 싶을 때 대비
     app_env: str = "dev"
 
+    # 앱 로거(resalehub.*) 레벨 (DEBUG로 바꾸면 Poshmark 자동화 단계별 로그 출력)
+    log_level: str = "INFO"
+
     # 보안 / JWT / DB
     secret_key: str
     algorithm: str = "HS256"
@@ -33,6 +36,11 @@ class Settings(BaseSettings):
     ebay_payment_policy_id: str | None = None
     ebay_return_policy_id: str | None = None
 
+    # Poshmark 자동화 디버깅 (실패 시 /tmp 에 스크린샷 저장)
+    poshmark_debug_screenshots: bool = False
+    # 공유 브라우저에서 동시에 실행할 Poshmark 작업 수 (Render 인스턴스 크기에 맞춰 조정)
+    poshmark_max_concurrent: int = 3
+
     # pydantic-settings v2 방식 설정
     model_config = SettingsConfigDict(
         env_file=".env",   # backend/.env 읽기
@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -10,6 +12,16 @@ from app.routers import health, auth, listings, listing_images, marketplaces
 # --- Load settings ---
 settings = get_settings()
 
+# --- Logging ---
+# uvicorn은 자체 로거만 설정하므로 앱 로거(resalehub.*)에 핸들러를 달아야 INFO 로그가 Render 로그에 남음
+app_logger = logging.getLogger("resalehub")
+if not app_logger.handlers:
+    log_handler = logging.StreamHandler()
+    log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    app_logger.addHandler(log_handler)
+    app_logger.propagate = False
+app_logger.setLevel(settings.log_level.upper())
+
 # --- Create DB tables ---
 Base.metadata.create_all(bind=engine)
 
@@ -142,6 +154,14 @@ async def check_playwright_browsers():
         print(">>> Please ensure 'playwright install chromium' is in Render.com build command")
 
 
+# --- Poshmark 공유 브라우저/HTTP 클라이언트 정리 (서버 종료 시 실행) ---
+@app.on_event("shutdown")
+async def close_poshmark_clients():
+    from app.services.poshmark_client import close_browser, close_http_client
+    await close_browser()
+    await close_http_client()
+
+
 # --- Routers ---
 app.include_router(health.router)
 app.include_router(auth.router)
@@ -22,6 +22,7 @@ from app.models.marketplace_account import MarketplaceAccount
 from app.services.ebay_client import ebay_get, ebay_post, ebay_put, ebay_delete, EbayAuthError
 from app.services.poshmark_client import (
     publish_listing as poshmark_publish_listing,
+    MAX_LISTING_IMAGES as POSHMARK_MAX_IMAGES,
     PoshmarkAuthError,
     PoshmarkPublishError,
 )
@@ -1658,11 +1659,12 @@ async def publish_to_poshmark(
     """
     listing = _get_owned_listing_or_404(listing_id, current_user, db)
     
-    # 이미지 가져오기
+    # 이미지 가져오기 (Poshmark 업로드 가능 장수만, 순서가 같으면 먼저 등록된 이미지 우선)
     listing_images = (
         db.query(ListingImage)
         .filter(ListingImage.listing_id == listing_id)
-        .order_by(ListingImage.sort_order.asc())
+        .order_by(ListingImage.sort_order.asc(), ListingImage.id.asc())
+        .limit(POSHMARK_MAX_IMAGES)
         .all()
     )
     
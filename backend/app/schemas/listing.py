@@ -1,8 +1,8 @@
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from typing import Optional, List
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 class ListingMarketplaceSchema(BaseModel):
     marketplace: str
@@ -54,4 +54,39 @@ class ListingRead(ListingBase):
     
     marketplace_links: List[ListingMarketplaceSchema] = []
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PoshmarkPublishPayload(BaseModel):
+    """Poshmark 업로드 폼 입력값 (브라우저 실행 전에 한 번만 검증/변환)"""
+    title: str = Field(default="Untitled", max_length=255)
+    description: str = "No description"
+    price: int = Field(gt=0)  # Poshmark는 정수 달러만 허용
+    brand: Optional[str] = None
+
+    @field_validator("title", "description", mode="before")
+    @classmethod
+    def _blank_to_default(cls, v, info):
+        if v is None or (isinstance(v, str) and not v.strip()):
+            return cls.model_fields[info.field_name].default
+        return v
+
+    @field_validator("price", mode="before")
+    @classmethod
+    def _price_to_int(cls, v):
+        # 가격이 없거나 숫자가 아니거나 유한하지 않으면 검증 에러 (0으로 바꿔 업로드하지 않음)
+        # 센트는 버리지 않고 가장 가까운 달러로 반올림
+        if v is None or v == "":
+            raise ValueError("price is required")
+        try:
+            value = Decimal(str(v))
+        except InvalidOperation:
+            raise ValueError(f"invalid price: {v!r}")
+        if not value.is_finite():
+            raise ValueError(f"invalid price: {v!r}")
+        return int(value.quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+    @field_validator("brand", mode="before")
+    @classmethod
+    def _blank_brand_to_none(cls, v):
+        return v or None
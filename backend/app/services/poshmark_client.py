@@ -6,17 +6,42 @@ Poshmark Playwright 자동화 클라이언트
 - 발행
 """
 import asyncio
+import logging
 import os
+import random
+import re
 import tempfile
+import time
+import weakref
+from functools import lru_cache
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import List, Optional
+from urllib.parse import quote, urljoin
+from uuid import uuid4
+import aiofiles
 import httpx
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Error as PlaywrightError,
+    Locator,
+    Page,
+    TimeoutError as PlaywrightTimeoutError,
+)
+from pydantic import ValidationError
+from selectolax.parser import HTMLParser, Node
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.models.marketplace_account import MarketplaceAccount
 from app.models.user import User
 from app.models.listing import Listing
 from app.models.listing_image import ListingImage
+from app.schemas.listing import PoshmarkPublishPayload
+
+
+logger = logging.getLogger("resalehub.poshmark")
 
 
 class PoshmarkAuthError(Exception):
@@ -29,10 +54,387 @@ class PoshmarkPublishError(Exception):
     pass
 
 
-async def get_poshmark_credentials(db: Session, user: User) -> tuple[str, str]:
+# 발행 후 URL에서 리스팅 ID 추출
+# Poshmark 리스팅 URL은 /listing/<제목-슬러그>-<24자리 hex ID> 형태이므로 끝의 ID만 캡처
+# (/closet/<username> 으로 이동한 경우 사용자명이 ID로 저장되지 않도록 listing 경로만 매칭)
+# closet 인벤토리도 같은 정규식으로 ID를 뽑아 발행 결과(external_item_id)와 맞춤 (대소문자 무시, 소문자로 저장)
+_LISTING_ID_RE = re.compile(r"/listing/(?:[^/?#]*-)?([a-f0-9]{24})(?:[/?#]|$)", re.IGNORECASE)
+
+
+# 로그인 세션 캐시: user_id -> (username, storage_state)
+# 로그인 후의 쿠키/localStorage를 보관했다가 다음 컨텍스트 생성 시 storage_state로 주입하여
+# 매 호출마다 로그인 페이지를 다시 거치지 않도록 함
+_session_states: dict[int, tuple[str, dict]] = {}
+
+
+def _get_session_state(user_id: int, username: str) -> Optional[dict]:
     """
-    DB에서 Poshmark 계정 정보 조회
-    Returns: (username, password)
+    저장된 로그인 세션 조회 (계정 username이 바뀌었으면 무시)
+    """
+    cached = _session_states.get(user_id)
+    if not cached or cached[0] != username:
+        return None
+    
+    # 만료된 쿠키는 한 번의 패스로 걸러냄 (expires == -1 은 브라우저 세션 쿠키)
+    state = cached[1]
+    now = time.time()
+    cookies = [c for c in state["cookies"] if c.get("expires", -1) < 0 or c["expires"] > now]
+    if not cookies:
+        _session_states.pop(user_id, None)
+        return None
+    if len(cookies) != len(state["cookies"]):
+        state = {**state, "cookies": cookies}
+        _session_states[user_id] = (username, state)
+    return state
+
+
+# Poshmark HTTP 요청용 공유 클라이언트 (keep-alive + HTTP/2로 TCP/TLS 연결 재사용, 요청 다중화)
+# 여러 사용자가 함께 쓰므로 응답 쿠키를 저장하지 않는 CookieJar 사용
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            headers={"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"},
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            follow_redirects=False,
+            timeout=10.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """
+    공유 HTTP 클라이언트 종료 (서버 종료 시 호출)
+    """
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def _session_is_valid(state: dict) -> bool:
+    """
+    저장된 세션 쿠키가 아직 로그인 상태인지 HTTP 요청 한 번으로 확인
+    (브라우저 페이지 로드 없이 /feed 응답이 로그인 페이지로 리다이렉트되는지만 확인)
+    """
+    cookie_header = "; ".join(
+        f"{c['name']}={c['value']}" for c in state["cookies"] if "poshmark.com" in c.get("domain", "")
+    )
+    try:
+        # 판단에는 상태 코드/Location 헤더만 필요 -> 스트리밍으로 열고 본문은 읽지 않음
+        async with _get_http_client().stream(
+            "GET",
+            "https://poshmark.com/feed",
+            headers={"Cookie": cookie_header},
+        ) as response:
+            location = response.headers.get("location", "").lower()
+            return not (response.is_redirect and "/login" in location)
+    except httpx.HTTPError as e:
+        # 판단 불가 -> 브라우저 단계에서 만료 여부를 다시 확인
+        logger.debug("Session check request failed: %s", e)
+        return True
+
+
+async def _login_and_save_session(
+    page: Page,
+    user_id: int,
+    username: str,
+    password: str,
+    quick: bool = False,
+) -> None:
+    """
+    로그인 후 컨텍스트의 storage_state를 세션 캐시에 저장
+    """
+    login_fn = login_to_poshmark_quick if quick else login_to_poshmark
+    login_success = await login_fn(page, username, password)
+    if not login_success:
+        raise PoshmarkAuthError("Login failed")
+    _session_states[user_id] = (username, await page.context.storage_state())
+
+
+@lru_cache(maxsize=1)
+def get_browser_launch_args() -> tuple[str, ...]:
+    """
+    컨테이너(Render.com) 환경용 Chromium 실행 옵션 (한 번만 만들고 캐시, 공유되므로 변경 불가한 tuple)
+    --single-process는 렌더러 작업을 한 프로세스로 직렬화하고 불안정하므로 사용하지 않음
+    """
+    return (
+        "--no-sandbox",
+        "--disable-setuid-sandbox",
+        "--disable-dev-shm-usage",  # /dev/shm 이 작은 컨테이너에서 크래시 방지
+        "--disable-gpu",
+        "--disable-accelerated-2d-canvas",
+        "--disable-background-timer-throttling",
+        "--disable-renderer-backgrounding",
+        "--disable-backgrounding-occluded-windows",
+        # 자동화에 필요 없는 백그라운드 서브시스템 비활성화
+        "--disable-background-networking",
+        "--disable-breakpad",
+        "--disable-component-extensions-with-background-pages",
+        "--disable-features=TranslateUI",
+        "--disable-ipc-flooding-protection",
+        "--mute-audio",
+        "--no-first-run",
+        "--no-default-browser-check",
+    )
+
+
+# 공유 브라우저: 요청마다 Chromium을 새로 띄우지 않도록 프로세스당 하나만 유지
+_playwright = None
+_browser: Optional[Browser] = None
+_browser_lock = asyncio.Lock()
+
+# 모든 페이지에서 차단할 리소스 확장자 (폰트/동영상)
+_BLOCKED_ASSET_EXTS = frozenset({"woff", "woff2", "ttf", "otf", "eot", "mp4", "webm", "m3u8"})
+# closet 조회 시 추가로 차단할 이미지 (src 속성만 읽으므로 실제 다운로드는 불필요)
+_BLOCKED_IMAGE_EXTS = frozenset({"png", "jpg", "jpeg", "webp", "gif", "svg", "ico"})
+
+
+def _extension_pattern(extensions: frozenset) -> re.Pattern:
+    """
+    확장자 집합으로 URL 매칭 정규식 생성 (glob과 달리 ?v=... 같은 쿼리 문자열이 붙어도 매칭)
+    """
+    return re.compile(r"\.(?:" + "|".join(sorted(extensions)) + r")(?:[?#]|$)", re.IGNORECASE)
+
+
+_BLOCKED_ASSET_RE = _extension_pattern(_BLOCKED_ASSET_EXTS)
+_BLOCKED_IMAGE_RE = _extension_pattern(_BLOCKED_IMAGE_EXTS)
+
+# 자동화에 필요 없는 서드파티 분석/광고 스크립트 호스트
+_BLOCKED_TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+)
+
+
+def _cdp_blocked_urls(extensions: frozenset) -> List[str]:
+    """
+    CDP Network.setBlockedURLs 용 와일드카드 패턴 생성 (확장자 + 쿼리 문자열 변형, 트래커 호스트)
+    """
+    patterns = []
+    for ext in sorted(extensions):
+        patterns += [f"*.{ext}", f"*.{ext}?*"]
+    patterns += [f"*{host}/*" for host in _BLOCKED_TRACKER_HOSTS]
+    return patterns
+
+
+_CDP_BLOCKED_URLS = _cdp_blocked_urls(_BLOCKED_ASSET_EXTS)
+_CDP_BLOCKED_URLS_NO_IMAGES = _cdp_blocked_urls(_BLOCKED_ASSET_EXTS | _BLOCKED_IMAGE_EXTS)
+
+# 사용자별 BrowserContext 캐시: user_id -> (username, context, last_used)
+# 같은 사용자의 연속 요청은 로그인된 컨텍스트를 그대로 재사용
+CONTEXT_IDLE_TTL = 600  # 초
+MAX_CACHED_CONTEXTS = 20  # 캐시할 컨텍스트 수 상한 (초과 시 가장 오래 쓰지 않은 것부터 닫음)
+PUBLISH_TIMEOUT = 120  # 초, 업로드 전체 작업의 상한
+NAVIGATION_TIMEOUT = 10000  # ms, 대화형 요청의 페이지 이동 상한 (초과 시 재시도 없이 대체 경로로)
+# dict 삽입 순서를 LRU 순서로 사용 (획득 시 pop, 반환 시 맨 뒤에 다시 삽입)
+_contexts: dict[int, tuple[str, BrowserContext, float]] = {}
+
+# Bulkhead: 공유 브라우저에서 동시에 실행되는 작업 수 제한 + 사용자별 직렬화
+_browser_slots = asyncio.Semaphore(get_settings().poshmark_max_concurrent)
+# 사용 중(보유/대기)인 잠금만 유지되도록 약한 참조로 보관 (사용자 수만큼 계속 쌓이지 않음)
+_user_locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+_reaper_task: Optional[asyncio.Task] = None
+
+
+def _user_lock(user_id: int) -> asyncio.Lock:
+    """
+    사용자별 작업 직렬화용 잠금 반환 (아무도 참조하지 않으면 자동으로 사라짐)
+    """
+    lock = _user_locks.get(user_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _user_locks[user_id] = lock
+    return lock
+
+
+async def _get_browser() -> Browser:
+    """
+    공유 브라우저 반환 (없거나 연결이 끊겼으면 새로 실행)
+    """
+    global _playwright, _browser
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            # 끊긴 브라우저에 속한 캐시 컨텍스트는 더 쓸 수 없으므로 비움
+            _contexts.clear()
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            try:
+                _browser = await _playwright.chromium.launch(headless=True, args=get_browser_launch_args())
+            except Exception as e:
+                if "Executable doesn't exist" in str(e) or "BrowserType.launch" in str(e):
+                    raise PoshmarkPublishError(
+                        "Playwright browser not installed. Please run 'playwright install chromium' "
+                        "or restart the server to auto-install browsers."
+                    )
+                raise
+        return _browser
+
+
+async def _acquire_context(user_id: int, username: str) -> tuple[BrowserContext, bool]:
+    """
+    사용자 컨텍스트 획득 (캐시된 컨텍스트 재사용, 없으면 저장된 세션으로 새로 생성)
+    Returns: (context, 로그인 세션 보유 여부)
+    """
+    cached = _contexts.pop(user_id, None)
+    if cached:
+        cached_username, context, last_used = cached
+        # 공유 브라우저가 죽었다가 다시 실행되었으면 이전 브라우저의 컨텍스트는 재사용하지 않음
+        browser_alive = context.browser is not None and context.browser.is_connected()
+        if browser_alive and cached_username == username and time.time() - last_used < CONTEXT_IDLE_TTL:
+            # 로그인 없이 공개 페이지만 본 컨텍스트일 수 있으므로 세션 보유 여부는 캐시로 판단
+            return context, _get_session_state(user_id, username) is not None
+        await _close_context(context)
+
+    # 저장된 세션이 만료되었는지 컨텍스트 생성 전에 HTTP로 먼저 확인
+    session_state = _get_session_state(user_id, username)
+    if session_state and not await _session_is_valid(session_state):
+        logger.info("Saved Poshmark session is no longer logged in, discarding")
+        _session_states.pop(user_id, None)
+        session_state = None
+
+    # 저장된 세션이 있으면 컨텍스트 생성 시 쿠키를 주입 (로그인 네비게이션 생략)
+    browser = await _get_browser()
+    context = await browser.new_context(
+        viewport={"width": 1280, "height": 720},
+        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+        storage_state=session_state,
+    )
+    return context, session_state is not None
+
+
+async def _new_page(
+    context: BrowserContext,
+    block_images: bool = False,
+    block_assets: Optional[bool] = None,
+) -> Page:
+    """
+    리소스 차단이 적용된 새 페이지 생성
+    폰트/동영상/트래커(block_images=True면 이미지까지)는 CDP Network.setBlockedURLs로
+    브라우저 안에서 바로 차단 (요청마다 Python 핸들러를 거치지 않음)
+    block_assets=False면 차단하지 않음 (기본값: 디버그 스크린샷 설정 시 실제 화면을 보도록 비활성화)
+    """
+    page = await context.new_page()
+    if block_assets is None:
+        block_assets = not get_settings().poshmark_debug_screenshots
+    if not block_assets:
+        return page
+    try:
+        cdp = await context.new_cdp_session(page)
+        await cdp.send("Network.enable")
+        await cdp.send(
+            "Network.setBlockedURLs",
+            {"urls": _CDP_BLOCKED_URLS_NO_IMAGES if block_images else _CDP_BLOCKED_URLS},
+        )
+    except PlaywrightError as e:
+        # CDP를 쓸 수 없으면 route 패턴으로 대체
+        logger.debug("CDP URL blocking unavailable, falling back to route: %s", e)
+        await page.route(_BLOCKED_ASSET_RE, lambda route: route.abort())
+        if block_images:
+            await page.route(_BLOCKED_IMAGE_RE, lambda route: route.abort())
+    return page
+
+
+async def _release_context(user_id: int, username: str, context: BrowserContext, reusable: bool) -> None:
+    """
+    사용이 끝난 컨텍스트 반환 (정상 종료 시 캐시에 보관, 실패 시 닫기)
+    """
+    if not reusable:
+        await _close_context(context)
+        return
+
+    previous = _contexts.pop(user_id, None)
+    _contexts[user_id] = (username, context, time.time())
+    if previous and previous[1] is not context:
+        # 같은 사용자의 동시 요청으로 생긴 중복 컨텍스트 정리
+        await _close_context(previous[1])
+
+    # 상한을 넘으면 가장 오래 사용되지 않은 컨텍스트부터 닫아 메모리 사용량 제한
+    while len(_contexts) > MAX_CACHED_CONTEXTS:
+        oldest_user_id = next(iter(_contexts))
+        _, oldest_context, _ = _contexts.pop(oldest_user_id)
+        await _close_context(oldest_context)
+
+    global _reaper_task
+    if _reaper_task is None or _reaper_task.done():
+        _reaper_task = asyncio.create_task(_reap_idle_contexts())
+
+
+async def _close_context(context: BrowserContext) -> None:
+    try:
+        await context.close()
+    except Exception:
+        pass
+
+
+async def _reap_idle_contexts() -> None:
+    """
+    TTL 동안 사용되지 않은 컨텍스트를 주기적으로 닫음 (캐시가 비면 종료)
+    """
+    while _contexts:
+        await asyncio.sleep(60)
+        now = time.time()
+        for user_id, (_, context, last_used) in list(_contexts.items()):
+            if now - last_used >= CONTEXT_IDLE_TTL and _contexts.get(user_id, (None, None))[1] is context:
+                del _contexts[user_id]
+                await _close_context(context)
+
+
+async def close_browser() -> None:
+    """
+    캐시된 컨텍스트와 공유 브라우저 종료 (서버 종료 시 호출)
+    """
+    global _playwright, _browser, _reaper_task
+    # 정리 태스크가 닫힌 브라우저를 계속 기다리지 않도록 먼저 취소
+    if _reaper_task is not None:
+        _reaper_task.cancel()
+        try:
+            await _reaper_task
+        except asyncio.CancelledError:
+            pass
+        _reaper_task = None
+    for _, context, _ in list(_contexts.values()):
+        await _close_context(context)
+    _contexts.clear()
+    if _browser is not None:
+        try:
+            await _browser.close()
+        except Exception:
+            pass
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+
+async def _retry_navigation(action, tries: int = 3, base_delay: float = 0.5):
+    """
+    일시적인 네트워크 오류(net::ERR_*)면 지터 백오프로 재시도
+    타임아웃은 이미 상한을 다 쓴 것이므로 재시도하지 않고 바로 전파 (호출자가 대체 경로 선택)
+    인증/업로드 에러(PoshmarkAuthError 등)나 그 외 Playwright 에러도 바로 전파
+    """
+    for attempt in range(tries):
+        try:
+            return await action()
+        except PlaywrightError as e:
+            transient = not isinstance(e, PlaywrightTimeoutError) and "net::ERR_" in str(e)
+            if not transient or attempt == tries - 1:
+                raise
+            delay = random.uniform(0, base_delay * 2 ** attempt)
+            logger.debug("Transient navigation error, retrying in %.2fs: %s", delay, str(e).splitlines()[0])
+            await asyncio.sleep(delay)
+
+
+def _get_poshmark_account(db: Session, user: User) -> MarketplaceAccount:
+    """
+    사용자의 Poshmark 계정 조회 (연결되지 않았으면 PoshmarkAuthError)
     """
     account = (
         db.query(MarketplaceAccount)
@@ -42,9 +444,17 @@ async def get_poshmark_credentials(db: Session, user: User) -> tuple[str, str]:
         )
         .first()
     )
-
     if not account:
         raise PoshmarkAuthError("Poshmark account not connected")
+    return account
+
+
+async def get_poshmark_credentials(db: Session, user: User) -> tuple[str, str]:
+    """
+    DB에서 Poshmark 계정 정보 조회
+    Returns: (username, password)
+    """
+    account = _get_poshmark_account(db, user)
 
     # username은 username 필드에, password는 access_token 필드에 저장 (임시)
     # 실제 운영 환경에서는 암호화된 저장 필요
@@ -66,37 +476,126 @@ async def verify_poshmark_credentials(username: str, password: str, headless: bo
     Args:
         headless: False로 설정하면 브라우저를 보여줌 (디버깅용)
     """
+    # 비어 있는 자격 증명은 브라우저 실행 없이 바로 실패 처리
+    if not username or not username.strip() or not password:
+        return False
+    
+    # Playwright 로그인 (봇 체크/로그인 실패 판단 포함)
+    # headless 검증은 공유 브라우저에 임시 컨텍스트만 만들어 수행 (디버깅용 headful 실행만 별도 브라우저)
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=headless)
-            context = await browser.new_context(
-                viewport={"width": 1280, "height": 720},
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            )
-            page = await context.new_page()
-            
+        async with _browser_slots:
+            # 실행/생성 도중 실패해도 실제로 만들어진 것만 정리하도록 모두 try 안에서 생성
+            owns_playwright = None
+            owned_browser = None
+            context = None
             try:
+                if headless:
+                    browser = await _get_browser()
+                else:
+                    owns_playwright = await async_playwright().start()
+                    owned_browser = await owns_playwright.chromium.launch(headless=False, args=get_browser_launch_args())
+                    browser = owned_browser
+                context = await browser.new_context(
+                    viewport={"width": 1280, "height": 720},
+                    user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+                )
+                page = await _new_page(context)
                 # 빠른 로그인 검증 (타임아웃 단축)
-                print(f">>> Starting quick login verification...")
+                logger.debug("Starting quick login verification")
                 login_success = await login_to_poshmark_quick(page, username, password)
                 return login_success
             finally:
-                await browser.close()
+                if context is not None:
+                    await asyncio.shield(_close_context(context))
+                if owned_browser is not None:
+                    try:
+                        await owned_browser.close()
+                    except Exception:
+                        pass
+                if owns_playwright is not None:
+                    await owns_playwright.stop()
     except Exception as e:
-        print(f">>> Credential verification error: {e}")
+        logger.warning("Credential verification error: %s", e)
         return False
 
 
+async def _wait_for_visible(page: Page, selectors: List[str], timeout: int) -> Optional[Locator]:
+    """
+    후보 셀렉터를 하나의 locator로 합쳐 처음 보이는 요소를 한 번만 대기
+    (셀렉터마다 순차로 타임아웃을 기다리지 않음) / 없으면 None
+    """
+    locator = page.locator(", ".join(selectors)).filter(visible=True).first
+    try:
+        await locator.wait_for(state="visible", timeout=timeout)
+    except PlaywrightTimeoutError:
+        return None
+    return locator
+
+
+# 로그인 에러 메시지 탐색 (셀렉터별 query_selector + inner_text 왕복 대신 브라우저 안에서 한 번에)
+# 보이는 에러 요소의 텍스트, 없으면 본문에서 실패 문구가 있는 줄을 반환
+_LOGIN_ERROR_JS = """
+(selector) => {
+    for (const el of document.querySelectorAll(selector)) {
+        if (el.offsetParent === null) continue;
+        const text = (el.innerText || '').trim();
+        if (text) return text;
+    }
+    const body = document.body ? document.body.innerText : '';
+    const line = body.split('\\n').find(l => /invalid|incorrect|wrong|failed/i.test(l));
+    return line ? line.trim() : null;
+}
+"""
+
+
+async def _find_login_error(page: Page, selector: str) -> Optional[str]:
+    """
+    로그인 페이지의 에러 메시지 반환 (없으면 None)
+    """
+    try:
+        return await page.evaluate(_LOGIN_ERROR_JS, selector)
+    except Exception:
+        return None
+
+
+async def _debug_screenshot(page: Page, name: str) -> Optional[str]:
+    """
+    디버깅용 스크린샷 저장 (poshmark_debug_screenshots 설정 시에만)
+    전체 페이지 대신 뷰포트만, PNG 대신 저화질 JPEG로 저장해 인코딩/디스크 비용 최소화
+    Returns: 저장 경로 또는 None
+    """
+    if not get_settings().poshmark_debug_screenshots:
+        return None
+    # 동시 실패 시 서로 덮어쓰지 않도록 파일명마다 고유 접미사
+    path = f"/tmp/{name}_{uuid4().hex[:8]}.jpg"
+    try:
+        await page.screenshot(path=path, type="jpeg", quality=50, full_page=False)
+    except Exception as e:
+        logger.warning("Could not save screenshot: %s", e)
+        return None
+    logger.info("Screenshot saved to %s for debugging", path)
+    return path
+
+
 async def login_to_poshmark_quick(page: Page, username: str, password: str) -> bool:
     """
     빠른 Poshmark 로그인 검증 (연결 시 사용)
     타임아웃을 줄여서 빠르게 검증합니다.
     """
     try:
-        print(f">>> Navigating to Poshmark login page (quick verification)...")
-        # 더 짧은 타임아웃으로 페이지 로드
-        await page.goto("https://poshmark.com/login", wait_until="domcontentloaded", timeout=15000)
-        await asyncio.sleep(1)  # 최소 대기
+        logger.debug("Navigating to Poshmark login page (quick verification)")
+        # 응답 헤더 수신(commit)까지만 대기 -> 아래 폼 대기가 실제 준비 상태를 확인
+        await _retry_navigation(
+            lambda: page.goto("https://poshmark.com/login", wait_until="commit", timeout=NAVIGATION_TIMEOUT)
+        )
+        # 고정 대기 대신 로그인 폼 또는 봇 체크 페이지("Just a moment...")가 뜰 때까지 대기
+        try:
+            await page.wait_for_function(
+                "() => document.querySelector('input[type=password]') !== null || document.title.includes('moment')",
+                timeout=10000
+            )
+        except PlaywrightTimeoutError:
+            pass
         
         # 이메일/사용자명 입력 필드 찾기 (빠른 검증)
         email_selectors = [
@@ -108,21 +607,12 @@ async def login_to_poshmark_quick(page: Page, username: str, password: str) -> b
             'input[placeholder*="username" i]',
         ]
         
-        email_field = None
-        for selector in email_selectors:
-            try:
-                email_field = await page.wait_for_selector(selector, timeout=5000, state="visible")
-                if email_field:
-                    print(f">>> Found email field: {selector}")
-                    break
-            except PlaywrightTimeoutError:
-                continue
-        
+        email_field = await _wait_for_visible(page, email_selectors, timeout=5000)
         if not email_field:
             raise PoshmarkAuthError("Could not find email/username input field")
         
         await email_field.fill(username)
-        print(f">>> Filled username")
+        logger.debug("Filled username")
         
         # 비밀번호 입력 필드
         password_selectors = [
@@ -130,21 +620,12 @@ async def login_to_poshmark_quick(page: Page, username: str, password: str) -> b
             'input[name*="password" i]',
         ]
         
-        password_field = None
-        for selector in password_selectors:
-            try:
-                password_field = await page.wait_for_selector(selector, timeout=5000, state="visible")
-                if password_field:
-                    print(f">>> Found password field: {selector}")
-                    break
-            except PlaywrightTimeoutError:
-                continue
-        
+        password_field = await _wait_for_visible(page, password_selectors, timeout=5000)
         if not password_field:
             raise PoshmarkAuthError("Could not find password input field")
         
         await password_field.fill(password)
-        print(f">>> Filled password")
+        logger.debug("Filled password")
         
         # 로그인 버튼 클릭
         login_button_selectors = [
@@ -153,21 +634,12 @@ async def login_to_poshmark_quick(page: Page, username: str, password: str) -> b
             'button:has-text("Log in")',
         ]
         
-        login_button = None
-        for selector in login_button_selectors:
-            try:
-                login_button = await page.wait_for_selector(selector, timeout=5000, state="visible")
-                if login_button:
-                    print(f">>> Found login button: {selector}")
-                    break
-            except PlaywrightTimeoutError:
-                continue
-        
+        login_button = await _wait_for_visible(page, login_button_selectors, timeout=5000)
         if not login_button:
             raise PoshmarkAuthError("Could not find login button")
         
         await login_button.click()
-        print(f">>> Clicked login button")
+        logger.debug("Clicked login button")
         
         # 로그인 완료 대기 (짧은 타임아웃)
         try:
@@ -176,60 +648,41 @@ async def login_to_poshmark_quick(page: Page, username: str, password: str) -> b
                 "() => window.location.href.indexOf('/login') === -1 || document.querySelector('.error, [class*=\"error\" i], [role=\"alert\"]') !== null",
                 timeout=10000
             )
-        except:
+        except Exception:
             # 타임아웃이어도 현재 URL 확인
             pass
         
         # 로그인 성공 확인
         current_url = page.url
-        print(f">>> After login, URL: {current_url}")
-        
-        # 에러 메시지 확인
-        error_selectors = [
-            '.error',
-            '[class*="error" i]',
-            '[role="alert"]',
-            'text=/invalid|incorrect|wrong|failed/i',
-        ]
-        for selector in error_selectors:
-            try:
-                error_element = await page.query_selector(selector)
-                if error_element:
-                    error_text = await error_element.inner_text()
-                    if error_text and len(error_text.strip()) > 0:
-                        print(f">>> Login error found: {error_text}")
-                        raise PoshmarkAuthError(f"Login failed: {error_text}")
-            except PoshmarkAuthError:
-                raise
-            except:
-                pass
+        logger.debug("After login, URL: %s", current_url)
         
-        # URL이 /login이 아니면 성공으로 간주
-        if "/login" not in current_url.lower() and "login" not in current_url.lower():
-            print(f">>> Login verification successful (redirected away from login page)")
+        # URL이 /login이 아니면 성공으로 간주 (성공 경로에서는 에러 메시지 탐색 생략)
+        if "login" not in current_url.lower():
+            logger.info("Login verification successful (redirected away from login page)")
             return True
         
-        # 사용자 메뉴 확인 (빠른 확인)
-        user_menu_selectors = [
-            'a[href*="/user/"]',
-            'a[href*="/closet/"]',
-            'button[aria-label*="Account" i]',
-        ]
+        # 에러 메시지 확인 (아직 로그인 페이지에 있을 때만)
+        error_text = await _find_login_error(page, '.error, [class*="error" i], [role="alert"]')
+        if error_text:
+            logger.warning("Login error found: %s", error_text)
+            raise PoshmarkAuthError(f"Login failed: {error_text}")
         
-        for selector in user_menu_selectors:
-            try:
-                await page.wait_for_selector(selector, timeout=3000)
-                print(f">>> Login verification successful (found user menu)")
-                return True
-            except PlaywrightTimeoutError:
-                continue
+        # 사용자 메뉴 확인 (빠른 확인)
+        # 후보 셀렉터를 하나로 합쳐 한 번만 대기 (셀렉터별 순차 타임아웃 누적 방지)
+        user_menu_selector = 'a[href*="/user/"], a[href*="/closet/"], button[aria-label*="Account" i]'
+        try:
+            await page.wait_for_selector(user_menu_selector, timeout=3000)
+            logger.info("Login verification successful (found user menu)")
+            return True
+        except PlaywrightTimeoutError:
+            pass
         
         # 여전히 로그인 페이지에 있으면 실패
         if "/login" in current_url.lower():
             raise PoshmarkAuthError("Login failed - still on login page")
         
         # 불확실하지만 로그인 페이지가 아니면 성공으로 간주
-        print(f">>> Login verification successful (not on login page)")
+        logger.info("Login verification successful (not on login page)")
         return True
         
     except PlaywrightTimeoutError as e:
@@ -252,16 +705,18 @@ async def login_to_poshmark(page: Page, username: str, password: str) -> bool:
     Returns: 성공 여부
     """
     try:
-        print(f">>> Navigating to Poshmark login page...")
-        # 더 긴 타임아웃과 domcontentloaded 사용 (더 빠른 로드)
-        await page.goto("https://poshmark.com/login", wait_until="domcontentloaded", timeout=60000)
+        logger.debug("Navigating to Poshmark login page")
+        # 응답 헤더 수신(commit)까지만 대기 (서드파티 스크립트 실행을 기다리지 않음)
+        # 페이지 준비 여부는 아래 입력 필드 대기로 확인
+        await _retry_navigation(
+            lambda: page.goto("https://poshmark.com/login", wait_until="commit", timeout=60000)
+        )
         
-        # 페이지가 완전히 로드될 때까지 추가 대기
-        await page.wait_for_load_state("networkidle", timeout=30000)
-        print(f">>> Page loaded, current URL: {page.url}")
+        # networkidle은 분석 비콘/롱폴링 때문에 자주 타임아웃됨 -> 아래 입력 필드 대기로 충분
+        logger.debug("Page loaded, current URL: %s", page.url)
         
         # 로그인 폼 찾기 (더 많은 셀렉터 옵션)
-        print(f">>> Looking for login form...")
+        logger.debug("Looking for login form")
         
         # 이메일/사용자명 입력 필드 - 더 많은 셀렉터 옵션
         email_selectors = [
@@ -279,29 +734,17 @@ async def login_to_poshmark(page: Page, username: str, password: str) -> bool:
             'input[autocomplete="email"]',
         ]
         
-        email_field = None
-        for selector in email_selectors:
-            try:
-                email_field = await page.wait_for_selector(selector, timeout=5000, state="visible")
-                if email_field:
-                    print(f">>> Found email field with selector: {selector}")
-                    break
-            except PlaywrightTimeoutError:
-                continue
-        
+        # commit 직후이므로 HTML 파싱/렌더링 시간까지 포함해 대기
+        email_field = await _wait_for_visible(page, email_selectors, timeout=15000)
         if not email_field:
-            # 페이지 스크린샷 저장 (디버깅용)
-            try:
-                await page.screenshot(path="/tmp/poshmark_login_page.png", full_page=True)
-                print(f">>> Screenshot saved to /tmp/poshmark_login_page.png for debugging")
-            except:
-                pass
+            # 페이지 스크린샷 저장 (디버깅용, 설정 시에만)
+            await _debug_screenshot(page, "poshmark_login_page")
             
-            # 페이지 HTML 일부 출력
+            # 페이지 텍스트 일부 출력 (브라우저에서 잘라서 500자만 전송)
             try:
-                body_text = await page.evaluate("() => document.body.innerText")
-                print(f">>> Page body text (first 500 chars): {body_text[:500]}")
-            except:
+                body_text = await page.evaluate("() => (document.body ? document.body.innerText : '').slice(0, 500)")
+                logger.debug("Page body text (first 500 chars): %s", body_text)
+            except Exception:
                 pass
             
             raise PoshmarkAuthError(
@@ -310,7 +753,7 @@ async def login_to_poshmark(page: Page, username: str, password: str) -> bool:
             )
         
         await email_field.fill(username)
-        print(f">>> Filled username/email")
+        logger.debug("Filled username/email")
         
         # 비밀번호 입력 필드 - 더 많은 옵션
         password_selectors = [
@@ -320,21 +763,12 @@ async def login_to_poshmark(page: Page, username: str, password: str) -> bool:
             'input[autocomplete="current-password"]',
         ]
         
-        password_field = None
-        for selector in password_selectors:
-            try:
-                password_field = await page.wait_for_selector(selector, timeout=5000, state="visible")
-                if password_field:
-                    print(f">>> Found password field with selector: {selector}")
-                    break
-            except PlaywrightTimeoutError:
-                continue
-        
+        password_field = await _wait_for_visible(page, password_selectors, timeout=5000)
         if not password_field:
             raise PoshmarkAuthError("Could not find password input field on Poshmark login page")
         
         await password_field.fill(password)
-        print(f">>> Filled password")
+        logger.debug("Filled password")
         
         # 로그인 버튼 찾기 - 더 많은 옵션
         login_button_selectors = [
@@ -349,81 +783,63 @@ async def login_to_poshmark(page: Page, username: str, password: str) -> bool:
             'form button',
         ]
         
-        login_button = None
-        for selector in login_button_selectors:
-            try:
-                login_button = await page.wait_for_selector(selector, timeout=5000, state="visible")
-                if login_button:
-                    print(f">>> Found login button with selector: {selector}")
-                    break
-            except PlaywrightTimeoutError:
-                continue
-        
+        # 명확한 로그인 버튼을 먼저 찾고, 없을 때만 일반 폼 버튼으로 대체 (DOM 순서상 다른 버튼 오선택 방지)
+        login_button = await _wait_for_visible(page, login_button_selectors[:6], timeout=5000)
+        if not login_button:
+            login_button = await _wait_for_visible(page, login_button_selectors[6:], timeout=2000)
         if not login_button:
             raise PoshmarkAuthError("Could not find login button on Poshmark login page")
         
         await login_button.click()
-        print(f">>> Clicked login button")
+        logger.debug("Clicked login button")
         
-        # 로그인 완료 대기 (리다이렉트 또는 대시보드 로드)
+        # 로그인 완료 대기 (networkidle 대신 URL 변경 / 사용자 메뉴 / 에러 메시지 중 하나)
         try:
-            await page.wait_for_load_state("networkidle", timeout=30000)
-        except:
-            # networkidle이 실패해도 계속 진행
-            await asyncio.sleep(3)
+            await page.wait_for_function(
+                "() => window.location.href.indexOf('/login') === -1 || document.querySelector('.header-user-profile, a[href*=\"/closet/\"], .error, [role=\"alert\"]') !== null",
+                timeout=15000
+            )
+        except PlaywrightTimeoutError:
+            # 타임아웃이어도 아래에서 현재 상태로 판단
+            pass
         
         # 로그인 성공 확인 (URL이 /login이 아니거나, 사용자 메뉴가 보이면 성공)
         current_url = page.url
-        print(f">>> After login, current URL: {current_url}")
+        logger.debug("After login, current URL: %s", current_url)
         
         if "/login" not in current_url.lower() and "login" not in current_url.lower():
-            print(f">>> Login successful, redirected to: {current_url}")
+            logger.info("Login successful, redirected to: %s", current_url)
             return True
         
         # 또는 사용자 프로필/메뉴 확인
-        user_menu_selectors = [
+        # 후보 셀렉터를 하나로 합쳐 한 번만 대기 (최악의 경우 7 x 5초 -> 5초)
+        user_menu_selector = ", ".join([
             'a[href*="/user/"]',
             'a[href*="/closet/"]',
             'button[aria-label*="Account" i]',
             '[data-testid*="user" i]',
             '[class*="user-menu" i]',
             '[class*="profile" i]',
-            'nav a[href*="/user/"]',
-        ]
-        
-        for selector in user_menu_selectors:
-            try:
-                await page.wait_for_selector(selector, timeout=5000)
-                print(f">>> Login successful, found user menu with: {selector}")
-                return True
-            except PlaywrightTimeoutError:
-                continue
+        ])
+        try:
+            await page.wait_for_selector(user_menu_selector, timeout=5000)
+            logger.info("Login successful, found user menu")
+            return True
+        except PlaywrightTimeoutError:
+            pass
         
         # 에러 메시지 확인
-        error_selectors = [
-            '.error',
-            '[class*="error" i]',
-            '[class*="alert" i]',
-            '[role="alert"]',
-            'text=/invalid|incorrect|wrong|failed/i',
-        ]
-        for selector in error_selectors:
-            try:
-                error_element = await page.query_selector(selector)
-                if error_element:
-                    error_text = await error_element.inner_text()
-                    if error_text and len(error_text.strip()) > 0:
-                        raise PoshmarkAuthError(f"Login failed: {error_text}")
-            except PoshmarkAuthError:
-                raise
-            except:
-                pass
+        error_text = await _find_login_error(
+            page, '.error, [class*="error" i], [class*="alert" i], [role="alert"]'
+        )
+        if error_text:
+            raise PoshmarkAuthError(f"Login failed: {error_text}")
         
         # URL이 여전히 /login이면 실패로 간주
         if "/login" in current_url.lower():
             raise PoshmarkAuthError("Login appears to have failed - still on login page")
         
-        print(f">>> Login status unclear, but not on login page - assuming success")
+        logger.debug("Login status unclear, but not on login page - assuming success")
         return True
         
     except PlaywrightTimeoutError as e:
@@ -441,9 +857,134 @@ async def login_to_poshmark(page: Page, username: str, password: str) -> bool:
         raise PoshmarkAuthError(f"Login failed: {str(e)}")
 
 
+async def _find_first_selector(page: Page, selectors: List[str], timeout: int = 3000):
+    """
+    셀렉터 목록을 순서대로 시도하여 처음 발견된 요소 반환
+    Returns: (element, selector) 또는 (None, None)
+    """
+    for selector in selectors:
+        try:
+            element = await page.wait_for_selector(selector, timeout=timeout, state="attached")
+            if element:
+                return element, selector
+        except PlaywrightTimeoutError:
+            continue
+    return None, None
+
+
+# 리스팅 입력 필드 일괄 입력: [[element, value], ...]
+# React 등이 값 변경을 감지하도록 네이티브 value setter로 설정한 뒤 input/change 이벤트 발생
+_FILL_FIELDS_JS = """
+(pairs) => {
+    for (const [el, value] of pairs) {
+        const proto = el instanceof HTMLTextAreaElement
+            ? HTMLTextAreaElement.prototype
+            : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+}
+"""
+
+
+# 이미지 다운로드 상한 (Poshmark 최대 8장)
+MAX_LISTING_IMAGES = 8
+MAX_IMAGE_BYTES = 10 * 1024 * 1024  # 이미지 1장
+MAX_TOTAL_IMAGE_BYTES = 40 * 1024 * 1024  # 리스팅 1건의 다운로드 합계
+IMAGE_DOWNLOAD_TIMEOUT = 20  # 초, 전체 다운로드 단계의 상한 (느린 이미지는 제외하고 진행)
+
+
+async def _download_image(
+    client: httpx.AsyncClient,
+    img: ListingImage,
+    base_url: str,
+    settings,
+    budget: dict,
+) -> Optional[str]:
+    """
+    이미지를 임시 파일로 다운로드 (실패/취소 시 임시 파일 삭제)
+    budget["remaining"]: 리스팅 전체에서 남은 다운로드 허용 바이트 (동시 다운로드가 공유)
+    Returns: 임시 파일 경로 또는 None
+    """
+    img_url = f"{base_url}{settings.media_url}/{img.file_path}"
+    suffix = os.path.splitext(img.file_path)[1] or '.jpg'
+    fd, temp_path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    completed = False
+    try:
+        # 전체 응답을 메모리에 올리지 않고 청크 단위로 비동기 기록
+        async with client.stream("GET", img_url) as response:
+            response.raise_for_status()
+            # 크기를 미리 알 수 있으면 본문을 받기 전에 건너뜀
+            content_length = int(response.headers.get("content-length") or 0)
+            if content_length > min(MAX_IMAGE_BYTES, budget["remaining"]):
+                raise PoshmarkPublishError(f"image too large ({content_length} bytes)")
+            received = 0
+            async with aiofiles.open(temp_path, "wb") as f:
+                async for chunk in response.aiter_bytes(65536):
+                    received += len(chunk)
+                    budget["remaining"] -= len(chunk)
+                    if received > MAX_IMAGE_BYTES or budget["remaining"] < 0:
+                        raise PoshmarkPublishError("image download size limit exceeded")
+                    await f.write(chunk)
+        completed = True
+        return temp_path
+    except Exception as e:
+        logger.warning("Failed to download %s: %s", img.file_path, e)
+        return None
+    finally:
+        if not completed:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+
+async def _prepare_upload_files(
+    listing_images: List[ListingImage],
+    base_url: str,
+    settings,
+    temp_files: List[str],
+) -> List[str]:
+    """
+    업로드할 이미지 파일 경로 준비 (로컬 파일 우선, 나머지는 병렬 다운로드 / 순서 유지)
+    다운로드한 임시 파일 경로는 호출자가 정리하도록 temp_files에 추가
+    크기 합계 상한을 넘거나 제한 시간 안에 끝나지 않은 이미지는 제외
+    """
+    budget = {"remaining": MAX_TOTAL_IMAGE_BYTES}
+    
+    async def resolve_image(client: httpx.AsyncClient, img: ListingImage) -> Optional[str]:
+        # 서버 로컬 media 파일은 HTTP 자기 호출 없이 경로를 그대로 사용
+        local_path = settings.media_root / img.file_path
+        if local_path.is_file():
+            return str(local_path)
+        temp_path = await _download_image(client, img, base_url, settings, budget)
+        if temp_path:
+            temp_files.append(temp_path)  # 다운로드한 임시 파일만 정리 대상
+        return temp_path
+    
+    # 다운로드는 하나의 클라이언트를 공유해 연결(TCP/TLS)을 재사용
+    async with httpx.AsyncClient(
+        timeout=15.0,
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+    ) as client:
+        tasks = [asyncio.create_task(resolve_image(client, img)) for img in listing_images]
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=IMAGE_DOWNLOAD_TIMEOUT)
+        finally:
+            # 시간 초과(또는 호출자 취소) 시 남은 다운로드 취소 (취소된 다운로드는 임시 파일을 스스로 삭제)
+            for task in tasks:
+                task.cancel()
+        if pending:
+            logger.warning("Skipping %d images that did not download in time", len(pending))
+    results = [task.result() for task in tasks if task in done and not task.exception()]
+    return [path for path in results if path]
+
+
 async def publish_listing_to_poshmark(
     page: Page,
-    listing: Listing,
+    payload: PoshmarkPublishPayload,
     listing_images: List[ListingImage],
     base_url: str,
     settings,
@@ -452,19 +993,28 @@ async def publish_listing_to_poshmark(
     Poshmark에 리스팅 업로드
     Returns: {listing_id, url, status}
     """
+    # 이미지 준비(로컬 파일 확인/다운로드)는 페이지와 무관하므로 먼저 시작해 페이지 이동과 겹치게 함
+    temp_files: List[str] = []
+    images_task: Optional[asyncio.Task] = None
+    if listing_images:
+        logger.debug("Preparing %d images", len(listing_images[:MAX_LISTING_IMAGES]))
+        images_task = asyncio.create_task(
+            _prepare_upload_files(listing_images[:MAX_LISTING_IMAGES], base_url, settings, temp_files)
+        )
+    
     try:
         # 1. "List an Item" 페이지로 이동 (가장 일반적인 URL만 사용)
-        print(f">>> Navigating to Poshmark listing page...")
+        logger.debug("Navigating to Poshmark listing page")
         listing_url = "https://poshmark.com/listing/new"
         
         try:
-            print(f">>> Loading: {listing_url}")
+            logger.debug("Loading: %s", listing_url)
             # load 이벤트만 대기 (더 빠름)
-            await page.goto(listing_url, wait_until="load", timeout=20000)
+            await _retry_navigation(lambda: page.goto(listing_url, wait_until="load", timeout=20000))
             
             # 리스팅 페이지인지 빠르게 확인
             current_url = page.url
-            print(f">>> Loaded page: {current_url}")
+            logger.debug("Loaded page: %s", current_url)
             
             # 필수 요소가 나타날 때까지만 대기 (networkidle 대신)
             try:
@@ -476,14 +1026,18 @@ async def publish_listing_to_poshmark(
                 )
             except PlaywrightTimeoutError:
                 # 필수 요소가 없어도 계속 진행 (페이지 구조가 다를 수 있음)
-                print(f">>> Warning: Could not find expected form elements, continuing anyway...")
+                logger.warning("Could not find expected form elements, continuing anyway")
                 
         except Exception as e:
             raise PoshmarkPublishError(f"Could not access Poshmark listing page: {str(e)}")
         
-        # 2. 이미지 업로드
-        if listing_images:
-            print(f">>> Uploading {len(listing_images)} images...")
+        # 저장된 세션이 만료되었으면 로그인 페이지로 리다이렉트됨
+        if "/login" in page.url.lower():
+            raise PoshmarkAuthError("Poshmark session expired")
+        
+        # 2. 이미지 업로드 (파일 준비는 함수 시작 시 백그라운드로 시작됨)
+        if images_task:
+            logger.debug("Uploading %d images", len(listing_images))
             
             # 이미지 파일 input 찾기
             image_input_selector = 'input[type="file"][accept*="image"], input[type="file"]'
@@ -491,122 +1045,90 @@ async def publish_listing_to_poshmark(
                 file_input = await page.wait_for_selector(image_input_selector, timeout=3000, state="attached")
                 
                 if file_input:
-                    # 이미지 다운로드 및 임시 파일로 저장 (병렬 처리)
-                    print(f">>> Downloading {len(listing_images[:8])} images in parallel...")
-                    
-                    async def download_image(img: ListingImage) -> Optional[str]:
-                        try:
-                            img_url = f"{base_url}{settings.media_url}/{img.file_path}"
-                            async with httpx.AsyncClient() as client:
-                                response = await client.get(img_url, timeout=15.0)
-                                if response.status_code == 200:
-                                    suffix = os.path.splitext(img.file_path)[1] or '.jpg'
-                                    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-                                    temp_file.write(response.content)
-                                    temp_file.close()
-                                    return temp_file.name
-                        except Exception as e:
-                            print(f">>> Failed to download {img.file_path}: {e}")
-                            return None
-                    
-                    # 병렬 다운로드
-                    download_tasks = [download_image(img) for img in listing_images[:8]]
-                    temp_files = [f for f in await asyncio.gather(*download_tasks) if f]
+                    upload_files = await images_task
                     
-                    if temp_files:
+                    if upload_files:
+                        # 파일 업로드
+                        await file_input.set_input_files(upload_files)
+                        logger.info("Uploaded %d images (%d downloaded)", len(upload_files), len(temp_files))
+                        
+                        # 업로드 완료 대기 (미리보기 이미지가 나타날 때까지)
                         try:
-                            # 파일 업로드
-                            await file_input.set_input_files(temp_files)
-                            print(f">>> Uploaded {len(temp_files)} images")
-                            
-                            # 업로드 완료 대기 (최소화)
-                            await asyncio.sleep(1)
-                        finally:
-                            # 임시 파일 정리
-                            for temp_file in temp_files:
-                                try:
-                                    os.unlink(temp_file)
-                                except:
-                                    pass
+                            await page.wait_for_selector(
+                                'img[src^="blob:"], .image-preview img, .uploaded-photo',
+                                timeout=10000,
+                                state="attached"
+                            )
+                        except PlaywrightTimeoutError:
+                            logger.warning("Image preview not detected, continuing")
                     else:
-                        print(f">>> Warning: No images were downloaded successfully")
+                        logger.warning("No images could be prepared for upload")
             except PlaywrightTimeoutError:
-                print(f">>> Image upload input not found, skipping...")
+                logger.warning("Image upload input not found, skipping")
         
-        # 3-5. 필수 필드 입력 (타임아웃 최소화)
-        print(f">>> Filling listing details...")
+        # 3-9. 필드 입력 (셀렉터 탐색은 병렬, 입력은 한 번에 일괄)
+        logger.debug("Filling listing details")
         
-        # 제목 입력
         title_selectors = [
             'input[name*="title" i]',
             'input[placeholder*="title" i]',
             'textarea[name*="title" i]',
             'input[type="text"]:first-of-type',
         ]
-        for selector in title_selectors:
-            try:
-                title_field = await page.wait_for_selector(selector, timeout=3000, state="attached")
-                if title_field:
-                    await title_field.fill(listing.title or "Untitled")
-                    print(f">>> Filled title: {listing.title}")
-                    break
-            except PlaywrightTimeoutError:
-                continue
-        
-        # 설명 입력
         description_selectors = [
             'textarea[name*="description" i]',
             'textarea[placeholder*="description" i]',
             'textarea[placeholder*="tell" i]',
             'textarea:first-of-type',
         ]
-        for selector in description_selectors:
-            try:
-                desc_field = await page.wait_for_selector(selector, timeout=3000, state="attached")
-                if desc_field:
-                    await desc_field.fill(listing.description or "No description")
-                    print(f">>> Filled description")
-                    break
-            except PlaywrightTimeoutError:
-                continue
-        
-        # 가격 입력
         price_selectors = [
             'input[name*="price" i]',
             'input[type="number"][placeholder*="price" i]',
             'input[placeholder*="$" i]',
             'input[type="number"]',
         ]
-        price = float(listing.price or 0)
-        for selector in price_selectors:
-            try:
-                price_field = await page.wait_for_selector(selector, timeout=3000, state="attached")
-                if price_field:
-                    await price_field.fill(str(int(price)))
-                    print(f">>> Filled price: ${price}")
-                    break
-            except PlaywrightTimeoutError:
+        # (필드명, 셀렉터 목록, 입력값, 셀렉터당 타임아웃)
+        fields = [
+            ("title", title_selectors, payload.title, 3000),
+            ("description", description_selectors, payload.description, 3000),
+            ("price", price_selectors, str(payload.price), 3000),
+        ]
+        # 선택적 필드 (빠르게 시도, 실패해도 계속)
+        if payload.brand:
+            brand_selectors = ['input[name*="brand" i]', 'input[placeholder*="brand" i]']
+            fields.append(("brand", brand_selectors, payload.brand, 2000))
+        
+        # 필드별 셀렉터 폴백 탐색을 동시에 실행 (최악의 경우 대기 시간이 합이 아닌 최대값)
+        found_fields = await asyncio.gather(
+            *[_find_first_selector(page, selectors, timeout) for _, selectors, _, timeout in fields]
+        )
+        
+        # 찾은 필드를 한 번의 evaluate로 일괄 입력 (필드마다 fill 왕복 대신)
+        to_fill = []
+        for (name, _, value, _), (field, _) in zip(fields, found_fields):
+            if not field:
+                logger.warning("Could not find %s field, skipping", name)
                 continue
+            to_fill.append((name, field, value))
         
-        # 6-9. 선택적 필드 (빠르게 시도, 실패해도 계속)
-        # 브랜드 입력 (있는 경우)
-        if listing.brand:
-            brand_selectors = ['input[name*="brand" i]', 'input[placeholder*="brand" i]']
-            for selector in brand_selectors:
-                try:
-                    brand_field = await page.wait_for_selector(selector, timeout=2000, state="attached")
-                    if brand_field:
-                        await brand_field.fill(listing.brand)
-                        print(f">>> Filled brand: {listing.brand}")
-                        break
-                except PlaywrightTimeoutError:
-                    continue
+        if to_fill:
+            try:
+                await page.evaluate(_FILL_FIELDS_JS, [[field, value] for _, field, value in to_fill])
+                for name, _, value in to_fill:
+                    logger.debug("Filled %s: %s", name, value if name != 'description' else '(...)')
+            except Exception as e:
+                # 일괄 입력 실패 시 기존 방식으로 필드별 순차 입력
+                # (fill은 포커스를 옮기므로 요소끼리 섞이지 않도록 순차)
+                logger.warning("Batch fill failed (%s), filling fields one by one", e)
+                for name, field, value in to_fill:
+                    try:
+                        await field.fill(value)
+                        logger.debug("Filled %s: %s", name, value if name != 'description' else '(...)')
+                    except Exception as fill_error:
+                        logger.warning("Failed to fill %s: %s", name, fill_error)
         
         # 10. "Publish" 또는 "List Item" 버튼 클릭
-        print(f">>> Looking for publish button...")
-        
-        # 최소 대기 (필요한 경우에만)
-        await asyncio.sleep(0.5)
+        logger.debug("Looking for publish button")
         
         publish_selectors = [
             'button:has-text("Publish")',
@@ -645,23 +1167,20 @@ async def publish_listing_to_poshmark(
                     is_visible = await publish_button.is_visible()
                     if is_visible:
                         used_selector = selector
-                        print(f">>> Found publish button with selector: {selector}")
+                        logger.debug("Found publish button with selector: %s", selector)
                         break
                     else:
                         publish_button = None
             except PlaywrightTimeoutError:
                 continue
             except Exception as e:
-                print(f">>> Error checking selector {selector}: {e}")
+                logger.debug("Error checking selector %s: %s", selector, e)
                 continue
         
         if not publish_button:
-            # 디버깅: 페이지 스크린샷 및 HTML 일부 저장
-            try:
-                await page.screenshot(path="/tmp/poshmark_listing_page.png", full_page=True)
-                print(f">>> Screenshot saved to /tmp/poshmark_listing_page.png")
-            except:
-                pass
+            # 디버깅: 페이지 스크린샷 저장 (설정 시에만)
+            screenshot_path = await _debug_screenshot(page, "poshmark_listing_page")
+            screenshot_note = f" Check screenshot at {screenshot_path}" if screenshot_path else ""
             
             # 페이지의 모든 버튼 찾기
             try:
@@ -674,52 +1193,48 @@ async def publish_listing_to_poshmark(
                             className: btn.className || '',
                             id: btn.id || '',
                             visible: btn.offsetParent !== null
-                        })).filter(btn => btn.visible && btn.text.length > 0);
+                        })).filter(btn => btn.visible && btn.text.length > 0).slice(0, 10);
                     }
                 """)
-                print(f">>> Found {len(all_buttons)} visible buttons on page:")
-                for btn in all_buttons[:10]:  # 처음 10개만 출력
-                    print(f">>>   - Text: '{btn['text']}', Type: {btn['type']}, Class: {btn['className'][:50]}")
+                logger.debug("First %d visible buttons on page:", len(all_buttons))
+                for btn in all_buttons:  # 처음 10개만 전송됨
+                    logger.debug("- Text: '%s', Type: %s, Class: %s", btn['text'], btn['type'], btn['className'][:50])
             except Exception as e:
-                print(f">>> Could not list buttons: {e}")
+                logger.warning("Could not list buttons: %s", e)
             
             raise PoshmarkPublishError(
                 "Could not find publish button on Poshmark listing page. "
-                "The page structure may have changed. Check screenshot at /tmp/poshmark_listing_page.png"
+                f"The page structure may have changed.{screenshot_note}"
             )
         
         # 버튼 클릭
         try:
-            # 스크롤하여 버튼이 보이도록
+            # 스크롤하여 버튼이 보이도록 (click이 actionability를 자체 대기)
             await publish_button.scroll_into_view_if_needed()
-            await asyncio.sleep(0.5)
             
             # 클릭 시도
             await publish_button.click(timeout=10000)
-            print(f">>> Clicked publish button: {used_selector}")
+            logger.info("Clicked publish button: %s", used_selector)
             
-            # 페이지 로드 대기
+            # 발행 완료 대기 (networkidle 대신 URL 변경 또는 완료 토스트)
             try:
-                await page.wait_for_load_state("networkidle", timeout=30000)
-            except:
-                await asyncio.sleep(3)  # networkidle 실패 시에도 대기
+                await page.wait_for_function(
+                    "() => window.location.href.indexOf('/listing/new') === -1 || /Listed just now|Your listing is live/i.test(document.body ? document.body.innerText : '')",
+                    timeout=30000,
+                    polling=500,
+                )
+            except PlaywrightTimeoutError:
+                logger.warning("Publish confirmation not detected, checking current URL")
                 
         except Exception as e:
             raise PoshmarkPublishError(f"Failed to click publish button: {str(e)}")
         
-        # 11. 업로드 완료 확인 및 URL 추출
-        await asyncio.sleep(2)  # 페이지 로드 대기
-        
+        # 11. 업로드 완료 확인 및 URL 추출 (완료 조건은 클릭 직후 대기에서 확인)
         current_url = page.url
-        listing_id = None
         
-        # URL에서 리스팅 ID 추출 시도
-        if "/closet/" in current_url or "/listing/" in current_url:
-            parts = current_url.split("/")
-            for i, part in enumerate(parts):
-                if part in ["closet", "listing"] and i + 1 < len(parts):
-                    listing_id = parts[i + 1]
-                    break
+        # URL에서 리스팅 ID 추출 시도 (모듈 로드 시 컴파일된 정규식 사용)
+        match = _LISTING_ID_RE.search(current_url)
+        listing_id = match.group(1).lower() if match else None
         
         return {
             "status": "published",
@@ -727,10 +1242,60 @@ async def publish_listing_to_poshmark(
             "external_item_id": listing_id,
         }
         
+    except PoshmarkAuthError:
+        raise
     except PlaywrightTimeoutError as e:
         raise PoshmarkPublishError(f"Publish timeout: {str(e)}")
     except Exception as e:
         raise PoshmarkPublishError(f"Publish failed: {str(e)}")
+    finally:
+        # 업로드 전에 실패했으면 진행 중인 다운로드 취소 (중단된 다운로드는 스스로 임시 파일 삭제)
+        # 취소가 끝날 때까지 기다려야 그 사이 추가된 임시 파일까지 정리되고, 태스크 예외도 회수됨
+        if images_task:
+            if not images_task.done():
+                images_task.cancel()
+            await asyncio.gather(images_task, return_exceptions=True)
+        # 다운로드한 임시 파일 정리
+        for temp_file in temp_files:
+            try:
+                os.unlink(temp_file)
+            except OSError:
+                pass
+
+
+async def _publish_on_page(
+    page: Page,
+    user_id: int,
+    username: str,
+    password: str,
+    has_session: bool,
+    payload: PoshmarkPublishPayload,
+    listing_images: List[ListingImage],
+    base_url: str,
+    settings,
+) -> dict:
+    """
+    (필요 시) 로그인 후 리스팅 업로드, 저장된 세션이 만료되었으면 한 번만 재로그인
+    """
+    # 로그인 (세션이 없을 때만)
+    if not has_session:
+        await _login_and_save_session(page, user_id, username, password)
+
+    # 리스팅 업로드
+    try:
+        return await publish_listing_to_poshmark(
+            page, payload, listing_images, base_url, settings
+        )
+    except PoshmarkAuthError:
+        if not has_session:
+            raise
+        # 저장된 세션 만료 -> 다시 로그인 후 한 번만 재시도
+        logger.info("Saved session expired, logging in again")
+        _session_states.pop(user_id, None)
+        await _login_and_save_session(page, user_id, username, password)
+        return await publish_listing_to_poshmark(
+            page, payload, listing_images, base_url, settings
+        )
 
 
 async def publish_listing(
@@ -743,56 +1308,150 @@ async def publish_listing(
 ) -> dict:
     """
     Poshmark에 리스팅 업로드 (메인 함수)
-    Playwright 브라우저를 열고, 로그인 후 업로드 수행
+    공유 브라우저의 사용자 컨텍스트에서 (필요 시) 로그인 후 업로드 수행
+    PUBLISH_TIMEOUT 안에 끝나지 않으면 취소하고 PoshmarkPublishError 발생
     """
     username, password = await get_poshmark_credentials(db, user)
     
+    # 입력값 검증/변환은 브라우저 작업 전에 한 번만 (잘못된 값이면 즉시 실패)
     try:
-        async with async_playwright() as p:
-            # 브라우저 실행 (headless=False로 디버깅 가능)
+        payload = PoshmarkPublishPayload(
+            title=listing.title,
+            description=listing.description,
+            price=listing.price,
+            brand=listing.brand,
+        )
+    except ValidationError as e:
+        # pydantic 기본 메시지는 여러 줄에 입력값/문서 URL까지 포함하므로 필드별 요약만 전달
+        details = "; ".join(
+            f"{err['loc'][0]}: {err['msg']}" if err["loc"] else err["msg"] for err in e.errors()
+        )
+        raise PoshmarkPublishError(f"Invalid listing data for Poshmark: {details}")
+
+    # 같은 사용자의 요청은 직렬화 (세션/컨텍스트 공유), 전체 동시 브라우저 작업 수는 제한
+    async with _user_lock(user.id), _browser_slots:
+        try:
+            context, has_session = await _acquire_context(user.id, username)
+        except PoshmarkPublishError:
+            raise
+        except Exception as e:
+            raise PoshmarkPublishError(f"Failed to launch browser: {str(e)}")
+
+        reusable = False
+        try:
             try:
-                browser = await p.chromium.launch(headless=True)
+                page = await _new_page(context)
             except Exception as e:
-                if "Executable doesn't exist" in str(e) or "BrowserType.launch" in str(e):
-                    raise PoshmarkPublishError(
-                        "Playwright browser not installed. Please run 'playwright install chromium' "
-                        "or restart the server to auto-install browsers."
-                    )
-                raise
-            
-            context = await browser.new_context(
-                viewport={"width": 1280, "height": 720},
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            )
-            page = await context.new_page()
-            
+                raise PoshmarkPublishError(f"Failed to open page: {str(e)}")
             try:
-                # 로그인
-                login_success = await login_to_poshmark(page, username, password)
-                if not login_success:
-                    raise PoshmarkAuthError("Login failed")
-                
-                # 리스팅 업로드
-                result = await publish_listing_to_poshmark(
-                    page, listing, listing_images, base_url, settings
+                result = await asyncio.wait_for(
+                    _publish_on_page(
+                        page, user.id, username, password, has_session,
+                        payload, listing_images, base_url, settings,
+                    ),
+                    timeout=PUBLISH_TIMEOUT,
                 )
-                
+                reusable = True
                 return result
-                
+            except asyncio.TimeoutError:
+                raise PoshmarkPublishError(f"Publish timed out after {PUBLISH_TIMEOUT} seconds")
             finally:
                 try:
-                    await browser.close()
-                except:
+                    # 취소 중에도 페이지가 남지 않도록 shield
+                    await asyncio.shield(page.close())
+                except Exception:
                     pass
-    except PoshmarkPublishError:
-        raise
-    except Exception as e:
-        if "Executable doesn't exist" in str(e) or "BrowserType.launch" in str(e):
-            raise PoshmarkPublishError(
-                "Playwright browser not installed. Please run 'playwright install chromium' "
-                "or restart the server to auto-install browsers."
-            )
-        raise PoshmarkPublishError(f"Failed to launch browser: {str(e)}")
+        finally:
+            await asyncio.shield(_release_context(user.id, username, context, reusable))
+
+
+# closet 페이지 준비 완료 조건: 리스팅 링크가 있고 로딩 표시가 없음
+_CLOSET_READY_JS = """
+() => document.querySelector('a[href*="/listing/"]') !== null
+    && !document.querySelector('[data-loading], .spinner')
+"""
+
+# closet HTML 파싱 기준
+_CARD_HINTS = ("tile", "card")
+_TITLE_SEL = '[class*="title"], [data-testid*="title"], h3, h4'
+_PRICE_SEL = '[class*="price"], [class*="amount"], [data-testid*="price"]'
+_CLOSET_LISTING_RE = re.compile(r"/listing/([^/?#]+)")
+_PRICE_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+
+def _find_card(link: Node) -> Node:
+    """
+    리스팅 링크의 가장 가까운 카드 조상 반환 (브라우저 closest() 와 같은 역할)
+    """
+    parent = link.parent
+    while parent is not None and parent.tag not in ("body", "html"):
+        hints = f"{parent.attributes.get('class') or ''} {parent.attributes.get('data-testid') or ''}"
+        if parent.tag == "article" or any(hint in hints for hint in _CARD_HINTS):
+            return parent
+        parent = parent.parent
+    return link
+
+
+def _parse_closet_html(html: str) -> List[dict]:
+    """
+    closet 페이지 HTML에서 리스팅 카드 정보 추출 (HTTP 응답 / 브라우저 렌더링 결과 공용)
+    리스팅 링크를 한 번 순회하며 가장 가까운 카드에서 제목/가격/이미지를 읽고 ID 기준으로 중복 제거
+    """
+    tree = HTMLParser(html)
+    items = []
+    seen = set()
+    for index, link in enumerate(tree.css('a[href*="/listing/"]')):
+        url = urljoin("https://poshmark.com", link.attributes.get("href") or "")
+        # 발행 시 저장하는 24자리 hex ID를 우선 사용하고, 없을 때만 URL 슬러그로 대체
+        id_match = _LISTING_ID_RE.search(url)
+        if id_match:
+            listing_id = id_match.group(1).lower()
+        else:
+            slug_match = _CLOSET_LISTING_RE.search(url)
+            listing_id = slug_match.group(1) if slug_match else ""
+        key = listing_id or url
+        if key in seen:
+            continue
+        card = _find_card(link)
+        
+        title_node = card.css_first(_TITLE_SEL) or link
+        title = title_node.text(separator=" ", strip=True)
+        
+        price_node = card.css_first(_PRICE_SEL)
+        price_match = _PRICE_NUMBER_RE.search(price_node.text().replace(",", "")) if price_node else None
+        price = float(price_match.group()) if price_match else 0
+        
+        img = card.css_first("img")
+        image_url = (img.attributes.get("src") or img.attributes.get("data-src") or "") if img else ""
+        
+        # 제목이 없는 링크(이미지 전용 등)는 건너뛰되 ID는 남겨 두어 같은 리스팅의 다음 링크에서 제목을 읽음
+        if title:
+            seen.add(key)
+            items.append({
+                "title": title,
+                "price": price,
+                "imageUrl": image_url,
+                "url": url,
+                "listingId": listing_id,
+                "sku": listing_id or f"poshmark-{index}",
+            })
+    return items
+
+
+async def _fetch_closet_http(closet_url: str) -> Optional[List[dict]]:
+    """
+    브라우저 없이 공개 closet 페이지를 HTTP로 받아 서버 렌더링된 리스팅 파싱
+    리다이렉트/리스팅 없음이면 빈 목록, 요청 자체가 실패(전송 오류)하면 None (호출자가 브라우저 경로로 대체)
+    """
+    try:
+        response = await _get_http_client().get(closet_url)
+    except httpx.HTTPError as e:
+        logger.debug("HTTP closet fetch failed: %s", e)
+        return None
+    if response.status_code != 200:
+        logger.debug("HTTP closet fetch returned %s", response.status_code)
+        return []
+    return _parse_closet_html(response.text)
 
 
 async def get_poshmark_inventory(db: Session, user: User) -> List[dict]:
@@ -801,82 +1460,72 @@ async def get_poshmark_inventory(db: Session, user: User) -> List[dict]:
     Returns: List of listing items
     """
     username, password = await get_poshmark_credentials(db, user)
-    
+    # HTTP/브라우저 경로 모두 같은 (인코딩된) closet URL 사용
+    closet_url = f"https://poshmark.com/closet/{quote(username)}"
+
+    # 빠른 경로: closet은 공개 페이지이므로 브라우저 없이 HTML만 받아 파싱
+    items = await _fetch_closet_http(closet_url)
+    http_failed = items is None
+    if items:
+        logger.info("Found %d items in closet (HTTP)", len(items))
+        return items
+
+    # 느린 경로: 스크립트로 렌더링되는 경우 등 HTTP로 찾지 못하면 브라우저로 조회
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                viewport={"width": 1280, "height": 720},
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            )
-            page = await context.new_page()
-            
+        async with _user_lock(user.id), _browser_slots:
+            context, has_session = await _acquire_context(user.id, username)
+            reusable = False
             try:
-                # 로그인
-                login_success = await login_to_poshmark_quick(page, username, password)
-                if not login_success:
-                    raise PoshmarkAuthError("Login failed")
-                
-                # 사용자의 closet 페이지로 이동
-                print(f">>> Navigating to closet page...")
-                closet_url = f"https://poshmark.com/closet/{username}"
-                await page.goto(closet_url, wait_until="load", timeout=20000)
-                await asyncio.sleep(2)  # 페이지 로드 대기
-                
-                # 리스팅 아이템 추출
-                print(f">>> Extracting listings from closet...")
-                items = await page.evaluate("""
-                    () => {
-                        const items = [];
-                        // Poshmark 리스팅 카드 선택자 (일반적인 구조)
-                        const cards = document.querySelectorAll('[data-testid*="tile"], .tile, .listing-tile, [class*="tile"]');
-                        
-                        cards.forEach((card, index) => {
-                            try {
-                                // 제목 추출
-                                const titleEl = card.querySelector('a[href*="/listing/"], [class*="title"], h3, h4');
-                                const title = titleEl ? titleEl.innerText.trim() : `Item ${index + 1}`;
-                                
-                                // 가격 추출
-                                const priceEl = card.querySelector('[class*="price"], [class*="amount"]');
-                                const priceText = priceEl ? priceEl.innerText.trim() : '';
-                                const price = parseFloat(priceText.replace(/[^0-9.]/g, '')) || 0;
-                                
-                                // 이미지 URL 추출
-                                const imgEl = card.querySelector('img');
-                                const imageUrl = imgEl ? imgEl.src : '';
-                                
-                                // 링크 추출
-                                const linkEl = card.querySelector('a[href*="/listing/"]');
-                                const url = linkEl ? linkEl.href : '';
-                                const listingId = url.match(/\\/listing\\/([^/]+)/)?.[1] || '';
-                                
-                                if (title && url) {
-                                    items.push({
-                                        title: title,
-                                        price: price,
-                                        imageUrl: imageUrl,
-                                        url: url,
-                                        listingId: listingId,
-                                        sku: listingId || `poshmark-${index}`,
-                                    });
-                                }
-                            } catch (e) {
-                                console.error('Error extracting item:', e);
-                            }
-                        });
-                        
-                        return items;
-                    }
-                """)
+                # 썸네일 이미지는 URL만 추출하므로 다운로드 차단
+                page = await _new_page(context, block_images=True)
+                try:
+                    # 사용자의 closet 페이지로 바로 이동
+                    # closet은 공개 페이지라 로그인 없이 먼저 시도하고, 로그인 페이지로 리다이렉트될 때만 로그인
+                    # 응답 헤더 수신(commit)까지만 대기 (서버 리다이렉트는 이미 반영됨) -> 아래 리스팅 대기가 준비 상태 확인
+                    logger.debug("Navigating to closet page %s", closet_url)
+                    await _retry_navigation(lambda: page.goto(closet_url, wait_until="commit", timeout=NAVIGATION_TIMEOUT))
+                    if "/login" in page.url.lower():
+                        if has_session:
+                            _session_states.pop(user.id, None)
+                        await _login_and_save_session(page, user.id, username, password, quick=True)
+                        await _retry_navigation(lambda: page.goto(closet_url, wait_until="commit", timeout=NAVIGATION_TIMEOUT))
+                        if "/login" in page.url.lower():
+                            raise PoshmarkAuthError("Poshmark closet page requires login")
+                    # 고정 대기 대신 리스팅 링크가 렌더링되고 로딩 표시가 사라질 때까지 한 번에 대기
+                    # (빈 closet이면 타임아웃 후 진행)
+                    try:
+                        await page.wait_for_function(_CLOSET_READY_JS, timeout=10000)
+                    except PlaywrightTimeoutError:
+                        logger.debug("No listing links rendered yet, extracting anyway")
                 
-                print(f">>> Found {len(items)} items in closet")
-                return items
+                    # 리스팅 아이템 추출 (렌더링된 DOM을 한 번 받아 HTTP 경로와 같은 파서로 처리)
+                    logger.debug("Extracting listings from closet")
+                    items = _parse_closet_html(await page.content())
+                    if not items:
+                        await _debug_screenshot(page, "poshmark_closet_empty")
                 
+                    logger.info("Found %d items in closet", len(items))
+                    reusable = True
+                    return items
+
+                finally:
+                    try:
+                        await asyncio.shield(page.close())
+                    except Exception:
+                        pass
             finally:
-                await browser.close()
+                await asyncio.shield(_release_context(user.id, username, context, reusable))
     except PoshmarkAuthError:
         raise
+    except PlaywrightTimeoutError as e:
+        # 브라우저 경로가 시간 내에 끝나지 않으면 기다리지 않고 실패 처리
+        # 처음 HTTP 요청이 전송 오류였을 때만 HTTP 경로를 한 번 더 시도 (응답을 받았는데 비어 있었다면 결과가 같음)
+        logger.warning("Closet page timed out: %s", str(e).splitlines()[0])
+        items = await _fetch_closet_http(closet_url) if http_failed else None
+        if items:
+            logger.info("Found %d items in closet (HTTP fallback)", len(items))
+            return items
+        raise PoshmarkPublishError("Failed to fetch inventory: closet page timed out")
     except Exception as e:
         raise PoshmarkPublishError(f"Failed to fetch inventory: {str(e)}")
 